@@ -11,10 +11,14 @@ It implements classes and utilities for managing DAP (Debug Access Port) probes,
 including probe discovery, connection handling, and communication. The module supports
 various probe interfaces and provides data structures for probe information management.
 """
-import ctypes
+import array
 import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from time import sleep
+from functools import cached_property
+from time import monotonic, sleep
 from typing import Any, Callable, cast
 
 import hid
@@ -30,26 +34,24 @@ logger = logging.getLogger("dapper")
 # todo(mkelnar) replace by trace flag and prepare formatter stdout/json for it
 deep_trace: bool = False
 
+# todo(mkelnar) supported_vendor_ids will be changed
+_USB_VIDS = frozenset({0x1FC9})  # nxp vid
+_HID_VIDS = frozenset({0x1FC9, 0xD28})  # nxp vid, dap link vid
+_HID_PIDS = frozenset({0x0090, 0x0143, 0x204})  # lpc-link, mcu-link, dap-link
+
 
 @dataclass
 class DapperProbeInfo:
-    """Class representing information about a DAP probe."""
+    """Class representing information about a DAP probe.
 
-    serial_no: str = ""
-    description: str = ""
-    device = None
+    :param serial_no: Serial number of the probe
+    :param description: Description or name of the probe
+    :param device: Associated device object
+    """
 
-    def __init__(self, serial_no: str, description: str, device: Any = None):
-        """Initialize a new DapperProbeInfo instance.
-
-        :param serial_no: Serial number of the probe
-        :param description: Description or name of the probe
-        :param device: Associated device object
-        """
-        super().__init__()
-        self.serial_no = serial_no
-        self.description = description
-        self.device = device
+    serial_no: str
+    description: str
+    device: Any = None
 
 
 @dataclass
@@ -73,26 +75,31 @@ class ProbeInfo:
         :param data: Dictionary containing probe information
         :return: New ProbeInfo instance
         """
-        instance = ProbeInfo()
-        instance.vendor_id = data.get("vendorId", "N/A")
-        instance.product_id = data.get("productId", "N/A")
-        instance.serial_no = data.get("serialNo", "N/A")
-        instance.firmware_ver = data.get("firmwareVer", "N/A")
-        instance.target_vendor = data.get("targetVendor", "N/A")
-        instance.target_name = data.get("targetName", "N/A")
-        instance.board_vendor = data.get("boardVendor", "N/A")
-        instance.board_name = data.get("boardName", "N/A")
-        instance.product_fw_ver = data.get("productFwVer", "N/A")
-        return instance
+        return ProbeInfo(
+            vendor_id=data.get("vendorId", "N/A"),
+            product_id=data.get("productId", "N/A"),
+            serial_no=data.get("serialNo", "N/A"),
+            firmware_ver=data.get("firmwareVer", "N/A"),
+            target_vendor=data.get("targetVendor", "N/A"),
+            target_name=data.get("targetName", "N/A"),
+            board_vendor=data.get("boardVendor", "N/A"),
+            board_name=data.get("boardName", "N/A"),
+            product_fw_ver=data.get("productFwVer", "N/A"),
+        )
 
 
-class Interface:
+class Interface(ABC):
     """Base class for probe interfaces.
 
     This class provides a common interface for working with different types of debug probes.
     It defines basic properties and methods that all probe interfaces should implement.
     """
 
+    # class level defaults, so that backends may resolve the strings lazily
+    vendor: str = ""
+    product: str = ""
+    serial_no: str = ""
+
     def __init__(self) -> None:
         """Initialize Interface instance.
 
@@ -102,9 +109,6 @@ class Interface:
         self._device: Any = None
         self.vid: int = 0
         self.pid: int = 0
-        self.vendor: str = ""
-        self.product: str = ""
-        self.serial_no: str = ""
         self.packet_size: int = 0
 
     @staticmethod
@@ -134,9 +138,9 @@ class Interface:
             raise RuntimeError("Device not initialized")
         return self._device.serial_number
 
-    @property
+    @cached_property
     def description(self) -> str:
-        """Get interface description.
+        """Get interface description, built on first access.
 
         :return: Description string combining vendor and product
         """
@@ -151,30 +155,27 @@ class Interface:
         if self._device is None:
             raise RuntimeError("USB device is undefined.")
 
+    @abstractmethod
     def close(self) -> None:
         """Close the interface connection.
 
         :return: None
-        :raises NotImplementedError: If not implemented in derived class
         """
-        raise NotImplementedError(f"{self.__class__}.close() must be implemented.")
 
+    @abstractmethod
     def write(self, data: Uint8Array) -> None:
         """Write data to interface.
 
         :param data: Data to write
         :return: None
-        :raises NotImplementedError: If not implemented in derived class
         """
-        raise NotImplementedError(f"{self.__class__}.write() must be implemented.")
 
+    @abstractmethod
     def read(self) -> Uint8Array:
         """Read data from interface.
 
         :return: Data read from interface
-        :raises NotImplementedError: If not implemented in derived class
         """
-        raise NotImplementedError(f"{self.__class__}.read() must be implemented.")
 
 
 class HidInterface(Interface):
@@ -205,6 +206,8 @@ class HidInterface(Interface):
         self.device_info = info
 
         self.packet_size = 64
+        # leading byte is the HID report ID, which is always 0
+        self._write_buffer = bytearray(self.packet_size)
 
     @staticmethod
     def list_probes() -> list[Interface]:
@@ -216,19 +219,17 @@ class HidInterface(Interface):
 
         devices = hid.enumerate()  # pylint: disable=c-extension-no-member
         for device_info in devices:
-            if device_info["vendor_id"] in {0x1FC9, 0xD28}:  # nxp vid, dap link vid
-                if device_info["product_id"] in {
-                    0x0090,
-                    0x0143,
-                    0x204,
-                }:  # lpc-link, mcu-link, dap-link
-                    if device_info["usage_page"] == 0xFF00:  # vendor defined usage page
-                        device = hid.device(  # pylint: disable=c-extension-no-member
-                            vendor_id=device_info["vendor_id"],
-                            product_id=device_info["product_id"],
-                            path=device_info["path"],
-                        )
-                        probes.append(HidInterface(device, device_info))
+            if (
+                device_info["vendor_id"] in _HID_VIDS
+                and device_info["product_id"] in _HID_PIDS
+                and device_info["usage_page"] == 0xFF00  # vendor defined usage page
+            ):
+                device = hid.device(  # pylint: disable=c-extension-no-member
+                    vendor_id=device_info["vendor_id"],
+                    product_id=device_info["product_id"],
+                    path=device_info["path"],
+                )
+                probes.append(HidInterface(device, device_info))
 
         return probes
 
@@ -251,16 +252,12 @@ class HidInterface(Interface):
 
         :param data: Data to write
         """
-        write_data = ([0] + list(data.buffer))[0:64]
+        length = min(len(data), self.packet_size - 1)
+        self._write_buffer[1 : 1 + length] = memoryview(data.buffer)[:length]
+        write_data = self._write_buffer[: 1 + length]
         self._device.write(write_data)
         if deep_trace:
-            print(
-                "write: ("
-                + str(len(data.buffer))
-                + ") ["
-                + ",".join(f"{x:02X}" for x in write_data[0:64])
-                + "]"
-            )
+            print(f"write: ({len(data.buffer)}) [{write_data.hex(',').upper()}]")
 
     def read(self) -> Uint8Array:
         """Read data from HID interface.
@@ -272,11 +269,9 @@ class HidInterface(Interface):
             raise RuntimeError("Device endpoint needs to be opened first.")
         data = self._device.read(self.packet_size)
         if deep_trace:
-            print(
-                "read:  (" + str(len(data)) + ") [" + ",".join(f"{x:02X}" for x in data[0:64]) + "]"
-            )
+            print(f"read:  ({len(data)}) [{bytes(data[0:64]).hex(',').upper()}]")
 
-        return Uint8Array((ctypes.c_uint8 * len(data))(*data))
+        return Uint8Array(bytearray(data))
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit the context manager.
@@ -310,14 +305,38 @@ class UsbInterface(Interface):
         self._device = device
         self._endpoint_in: Optional[usb.core.Endpoint] = None
         self._endpoint_out: Optional[usb.core.Endpoint] = None
+        self._ep_write: Optional[Callable] = None
+        self._ep_read: Optional[Callable] = None
+        self._rx_buffer = array.array("B")
 
-        self.serial_no = device.serial_number
-        self.vendor = device.manufacturer
-        self.product = device.product
         self.vid = device.idVendor
         self.pid = device.idProduct
         self.packet_size = 64
 
+    @cached_property
+    def serial_no(self) -> str:  # type: ignore[override]
+        """Get serial number of the probe, read on first access.
+
+        :return: Serial number string
+        """
+        return self._device.serial_number
+
+    @cached_property
+    def vendor(self) -> str:  # type: ignore[override]
+        """Get manufacturer name of the probe, read on first access.
+
+        :return: Manufacturer string
+        """
+        return self._device.manufacturer
+
+    @cached_property
+    def product(self) -> str:  # type: ignore[override]
+        """Get product name of the probe, read on first access.
+
+        :return: Product string
+        """
+        return self._device.product
+
     @staticmethod
     def list_probes() -> list[Interface]:
         """List available USB probes.
@@ -325,16 +344,22 @@ class UsbInterface(Interface):
         :return: List of available USB interfaces
         """
         probes: list[Interface] = []
-        # todo(mkelnar) supported_vendor_ids will be changed
-        for vid in list([0x1FC9]):
-            usb_devices = libusb_package.find(find_all=True, idVendor=vid)
-            for usb_device in usb_devices:
-                if usb_device.bDeviceClass in {0x00, 0xEF}:  # not HID
-                    config = usb_device.get_active_configuration()
-                    ifaces = usb.util.find_descriptor(config, find_all=True)
-                    for iface in ifaces:
-                        if iface.bInterfaceClass == 0xFF:  # nxp specific interface
-                            probes.append(UsbInterface(usb_device))
+        # single bus enumeration regardless of the number of supported vendors, devices are
+        # matched on the cached device descriptor before any of them is opened
+        usb_devices = libusb_package.find(
+            find_all=True,
+            custom_match=lambda dev: dev.idVendor in _USB_VIDS
+            and dev.bDeviceClass in {0x00, 0xEF},  # not HID
+        )
+        for usb_device in usb_devices:
+            try:
+                config = usb_device.get_active_configuration()
+            except usb.core.USBError as e:
+                logger.debug(f"Skipping USB device {usb_device.bus}:{usb_device.address}: {e}")
+                continue
+            # the probe is listed once even if it exposes more nxp specific interfaces
+            if any(iface.bInterfaceClass == 0xFF for iface in config):
+                probes.append(UsbInterface(usb_device))
         return probes
 
     def open(self) -> None:
@@ -344,30 +369,39 @@ class UsbInterface(Interface):
         """
         super().open()
 
-        logger.info(f"Device to open: {self._device.product} ({self._device.manufacturer})")
+        logger.info(f"Device to open: {self.product} ({self.vendor})")
 
         self._device.set_configuration()
         cfg = self._device.get_active_configuration()
         interfaces = cfg[(0, 0)]
 
-        self._endpoint_in = usb.util.find_descriptor(
-            interfaces,
-            custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress)
-            == usb.util.ENDPOINT_IN,
-        )
-        self._endpoint_out = usb.util.find_descriptor(
-            interfaces,
-            custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress)
-            == usb.util.ENDPOINT_OUT,
-        )
+        self._endpoint_in = self._endpoint_out = None
+        for endpoint in interfaces:
+            # bit 7 of the endpoint address is the direction, first endpoint of each wins
+            if endpoint.bEndpointAddress & usb.util.ENDPOINT_IN:
+                if self._endpoint_in is None:
+                    self._endpoint_in = endpoint
+            elif self._endpoint_out is None:
+                self._endpoint_out = endpoint
+            if self._endpoint_in is not None and self._endpoint_out is not None:
+                break
 
         if self._endpoint_in is None or self._endpoint_out is None:
             raise RuntimeError("Unable to fine USB device endpoints.")
+        self._ep_write = self._endpoint_out.write
+        self._ep_read = self._endpoint_in.read
+
+        # full speed probes use 64 byte packets, high speed ones up to 512
+        self.packet_size = self._endpoint_in.wMaxPacketSize
+        # libusb fills this buffer in place on every read
+        self._rx_buffer = usb.util.create_buffer(self.packet_size)
 
     def close(self) -> None:
         """Close the USB interface connection."""
         self._endpoint_in = None
         self._endpoint_out = None
+        self._ep_write = None
+        self._ep_read = None
 
     def write(self, data: Uint8Array) -> None:
         """Write data to USB interface.
@@ -375,25 +409,29 @@ class UsbInterface(Interface):
         :param data: Data to write
         :raises RuntimeError: If device endpoint is not opened or data is not Uint8Array
         """
-        if self._endpoint_out is None:
+        if self._ep_write is None:
             raise RuntimeError("Device endpoint needs to be opened first.")
-        if not isinstance(data, Uint8Array):
+        # the WASM module always passes Uint8Array, the check is dropped under python -O
+        if __debug__ and not isinstance(data, Uint8Array):
             raise RuntimeError("Data must be an instance of Uint8Array.")
-        self._endpoint_out.write(data.buffer, self.packet_size)
+        self._ep_write(data.buffer)
 
     def read(self) -> Uint8Array:
         """Read data from USB interface.
 
+        The returned array is a view of the interface receive buffer and is valid only until
+        the next read.
+
         :return: Data read from interface
         :raises RuntimeError: If device endpoint is not opened
         """
-        if self._endpoint_in is None:
+        if self._ep_read is None:
             raise RuntimeError("Device endpoint needs to be opened first.")
-        data = self._endpoint_in.read(self.packet_size)
-        return Uint8Array((ctypes.c_uint8 * len(data))(*data))
+        length = self._ep_read(self._rx_buffer)
+        return Uint8Array(self._rx_buffer, 0, length)
 
 
-class WebixDapper:  # pylint: disable=too-many-public-methods
+class WebixDapper:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """WebixDapper class for handling WASM-based DAP operations."""
 
     def __init__(self, context_path: Optional[str] = None) -> None:
@@ -409,6 +447,7 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
 
         self.read_data_handler: Optional[Callable] = None
         self.write_data_handler: Optional[Callable] = None
+        self._supported_vendor_ids: Optional[tuple[int, ...]] = None
 
         self.context_path = context_path
 
@@ -478,6 +517,10 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
             self._read_data_handler = handler
         else:
             self._read_data_handler = self.read_data_usb
+        # read_data() reads the interface itself for the handler defined by this class
+        self._read_data_direct = (
+            getattr(self._read_data_handler, "__func__", None) is WebixDapper.read_data_usb
+        )
 
     @property
     def write_data_handler(self) -> Optional[Callable]:
@@ -497,6 +540,10 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
             self._write_data_handler = handler
         else:
             self._write_data_handler = self.write_data_usb
+        # write_data() writes the interface itself for the handler defined by this class
+        self._write_data_direct = (
+            getattr(self._write_data_handler, "__func__", None) is WebixDapper.write_data_usb
+        )
 
     def read_data_usb(self) -> Uint8Array:
         """Read data from USB interface.
@@ -522,15 +569,26 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
         """Read data using the configured read data handler.
 
         :return: Data read as Uint8Array
+        :raises RuntimeError: If device interface is not opened
         """
+        if self._read_data_direct:
+            if self.interface is None:
+                raise RuntimeError("Device interface needs to be opened first.")
+            return self.interface.read()
         return self._read_data_handler()
 
     def write_data(self, data: Uint8Array) -> None:
         """Write data using the configured write data handler.
 
         :param data: Data to write as Uint8Array
+        :raises RuntimeError: If device interface is not opened
         """
-        self._write_data_handler(data)
+        if self._write_data_direct:
+            if self.interface is None:
+                raise RuntimeError("Device interface needs to be opened first.")
+            self.interface.write(data)
+        else:
+            self._write_data_handler(data)
 
     def stdout(self, data: Uint8Array) -> None:
         """Handle stdout data.
@@ -551,28 +609,11 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
         module_instance = WebixDapperWasm(self.context_path)
         module_instance.runtime_init()
 
-        def writeData(  # pylint: disable=invalid-name
-            instance: "WebixDapper", data: Uint8Array
-        ) -> None:
-            # pylint: disable=unused-argument
-            self.write_data(data)
-
-        def readData(instance: "WebixDapper") -> Uint8Array:  # pylint: disable=invalid-name
-            # pylint: disable=unused-argument
-            return self.read_data()
-
-        def stdout(instance: "WebixDapper", data: Uint8Array) -> None:
-            # pylint: disable=unused-argument
-            self.stdout(data)
-
-        def stderr(instance: "WebixDapper", data: Uint8Array) -> None:
-            # pylint: disable=unused-argument
-            self.stderr(data)
-
-        module_instance.register_handler(readData)
-        module_instance.register_handler(writeData)
-        module_instance.register_handler(stdout)
-        module_instance.register_handler(stderr)
+        # bound methods are called by the module directly, without a wrapping closure frame
+        module_instance.register_handler(self.read_data, "readData")
+        module_instance.register_handler(self.write_data, "writeData")
+        module_instance.register_handler(self.stdout, "stdout")
+        module_instance.register_handler(self.stderr, "stderr")
         self._module = module_instance
 
     def reinit_target(self) -> None:
@@ -583,8 +624,12 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
 
         :return: List of supported vendor IDs
         """
-        # pylint: disable=no-member
-        return list(self.module.getSupportedVendorIDs())  # type: ignore[attr-defined]
+        # the list is built into the WASM module, ask for it only once
+        if self._supported_vendor_ids is None:
+            # pylint: disable=no-member
+            vendor_ids = self.module.getSupportedVendorIDs()  # type: ignore[attr-defined]
+            self._supported_vendor_ids = tuple(vendor_ids)
+        return list(self._supported_vendor_ids)
 
     def get_probe_id(self) -> Optional[str]:
         """Get the probe ID.
@@ -641,21 +686,19 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
         # Write power control request
         self.core_sight_write(False, 0x04, req)
 
-        # Wait for power control to complete with timeout
-        index = 10
-        succeed = False
-
-        while index >= 0:
-            sleep(0.1)
+        # Wait for power control to complete with timeout, the acknowledge usually comes within
+        # a few milliseconds so start polling fast and back off up to 50 ms
+        deadline = monotonic() + 1.1
+        delay = 0.001
+        while True:
             ret = self.core_sight_read(False, 0x04)
             # Check if power control status matches expected value
             if (ret & (0x80 << 24 | 0x20 << 24)) == check_status:
-                succeed = True
-                break
-            index -= 1
-
-        if not succeed:
-            raise RuntimeError("Failed to control device power")
+                return
+            if monotonic() >= deadline:
+                raise RuntimeError("Failed to control device power")
+            sleep(delay)
+            delay = min(delay * 2, 0.05)
 
     def connect(self) -> None:
         """Connect to the device and control power."""
@@ -688,7 +731,7 @@ class WebixDapper:  # pylint: disable=too-many-public-methods
         :return: Read value
         """
         # pylint: disable=no-member
-        return self.module.coreSightRead(access_port, address) & 0xFFFFFFFF  # type: ignore[attr-defined]
+        return self.module.coreSightRead(access_port, address)  # type: ignore[attr-defined]
 
     def core_sight_write(self, access_port: bool, address: int, data: int) -> None:
         """Write to CoreSight.
@@ -706,13 +749,22 @@ class DapperFactory:
 
     :param _instance: Singleton instance of DapperFactory
     :param _dapper: WebixDapper instance
+    :param _lock: Lock guarding the lazy creation of the singleton and WebixDapper instances
+    :param interfaces: Probe interface backends in order of preference
     :param probes: List of available probes
+    :param _probes_by_serial: Available probes by their serial numbers
+    :param probes_cache_ttl: Time in seconds for which the listed probes are reused
     :param path: Path to WASM file
     """
 
     _instance: Optional["DapperFactory"] = None
     _dapper: Optional[WebixDapper] = None
+    _lock = threading.Lock()
+    interfaces: tuple[type[Interface], ...] = (UsbInterface, HidInterface)
     probes: list[Interface] = []
+    _probes_by_serial: dict[str, Interface] = {}
+    probes_cache_ttl: float = 2.0
+    _probes_time: Optional[float] = None
     path: Optional[str] = None
 
     def __init__(self) -> None:
@@ -728,8 +780,12 @@ class DapperFactory:
         :return: WebixDapper instance
         """
         if self._dapper is None:
-            self._dapper = WebixDapper(self.path)
-            self._dapper.init()
+            with self._lock:
+                # instantiating the WASM runtime is expensive, do it once for concurrent callers
+                if self._dapper is None:
+                    dapper = WebixDapper(self.path)
+                    dapper.init()
+                    self._dapper = dapper
 
         return self._dapper
 
@@ -740,7 +796,9 @@ class DapperFactory:
         :return: DapperFactory instance
         """
         if cls._instance is None:
-            cls._instance = cls.__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls.__new__(cls)
         return cls._instance
 
     @classmethod
@@ -755,16 +813,43 @@ class DapperFactory:
     def list_probes(cls) -> list[Interface]:
         """List all available probes.
 
+        Bus enumeration is slow, the result is reused for ``probes_cache_ttl`` seconds.
+
         :return: List of available probes
         """
-        probes = UsbInterface.list_probes()
-        hid_to_add = []
-        for hid_device in HidInterface.list_probes():
-            if hid_device.serial_no not in {probe.serial_no for probe in probes}:
-                hid_to_add.append(hid_device)
-        probes += hid_to_add
+        now = monotonic()
+        if cls._probes_time is not None and now - cls._probes_time < cls.probes_cache_ttl:
+            return list(DapperFactory.probes)
+
+        def list_interface_probes(interface: type[Interface]) -> Optional[list[Interface]]:
+            try:
+                return interface.list_probes()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug(f"Listing of {interface.__name__} probes failed: {str(e)}")
+                return None
+
+        # each backend enumerates its own bus, let them wait for the devices concurrently
+        with ThreadPoolExecutor(max_workers=max(len(cls.interfaces), 1)) as executor:
+            interfaces_probes = list(executor.map(list_interface_probes, cls.interfaces))
+
+        probes: list[Interface] = []
+        known_serials: set[str] = set()
+        for interface_probes in interfaces_probes:
+            if interface_probes is None:
+                continue
+            # the same probe may be exposed by several backends, keep the preferred one
+            probes += [probe for probe in interface_probes if probe.serial_no not in known_serials]
+            known_serials.update(probe.serial_no for probe in interface_probes)
         DapperFactory.probes = probes
-        return probes
+        DapperFactory._probes_by_serial = {probe.serial_no: probe for probe in probes}
+        # a failed backend may be a transient error, do not hide its probes until the cache expires
+        DapperFactory._probes_time = None if None in interfaces_probes else now
+        return list(probes)
+
+    @classmethod
+    def invalidate_probes(cls) -> None:
+        """Force the next probes listing to enumerate the buses again."""
+        DapperFactory._probes_time = None
 
     @classmethod
     def create_probe(cls, probe: Union[Interface, str]) -> WebixDapper:
@@ -772,18 +857,28 @@ class DapperFactory:
 
         :param probe: Probe interface or serial number
         :return: WebixDapper instance
-        :raises RuntimeError: If probe type is not supported
+        :raises RuntimeError: If probe type is not supported or the probe is not found
         """
-        dapper = cls.instance().dapper()
         probe_iface = None
         if isinstance(probe, str):
-            for prb in DapperFactory.probes:
-                if prb.serial_no == probe:
-                    probe_iface = prb
+            probe_iface = DapperFactory._probes_by_serial.get(probe)
+            if probe_iface is None:
+                # the probe may have been attached since the last listing
+                cls.invalidate_probes()
+                cls.list_probes()
+                probe_iface = DapperFactory._probes_by_serial.get(probe)
+            if probe_iface is None:
+                raise RuntimeError(f"Probe with serial number '{probe}' not found.")
         elif isinstance(probe, Interface):
             probe_iface = probe
         else:
             raise RuntimeError("Not supported probe type detected")
 
-        dapper.open(probe_iface)
+        dapper = cls.instance().dapper()
+        try:
+            dapper.open(probe_iface)
+        except Exception:
+            # the probe may have been unplugged since it was listed
+            cls.invalidate_probes()
+            raise
         return dapper
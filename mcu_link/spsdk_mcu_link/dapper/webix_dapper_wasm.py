@@ -5,28 +5,25 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import array
 import ctypes
+import hashlib
 import logging
 import os
+import struct
 import sys
+import threading
 import types
+from importlib.metadata import PackageNotFoundError, version
 from time import sleep
-from typing import Any, Callable, Optional, Tuple, Union, cast
+from typing import Any, Callable, ClassVar, Optional, Tuple, Union, cast
 
 import wasmtime
-from wasmtime import (
-    Config,
-    Engine,
-    Func,
-    FuncType,
-    Instance,
-    Limits,
-    Linker,
-    Memory,
-    MemoryType,
-    Module,
-    Store,
-)
+from wasmtime import Config, Engine, Func, FuncType, Instance, Module, Store
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U32X2 = struct.Struct("<II")
 
 logger = logging.getLogger(__name__)
 if logger.level == logging.NOTSET:
@@ -39,26 +36,33 @@ if not logger.handlers:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+INT32_SIZE = ctypes.sizeof(ctypes.c_int32)
+
 
 class Uint8Array:
     """8-bit unsigned integer array implementation."""
 
     def __init__(
         self,
-        source: Union[ctypes.Array, "Uint8Array"],
+        source: Union[ctypes.Array, "Uint8Array", bytes, bytearray, memoryview, array.array],
         offset: int = 0,
         length: Optional[int] = None,
     ) -> None:
         """8-bit unsigned integer array implementation.
 
-        :param source: Source array to create from
+        Writable buffers (ctypes arrays, bytearray, array.array) are wrapped without copying,
+        read-only buffers such as bytes are copied once.
+
+        :param source: Source array or buffer to create from
         :param offset: Starting offset in the source array, defaults to 0
         :param length: Length of the array to create, defaults to None
         :raises TypeError: If source is not a valid array type
         :raises ValueError: If offset or length are invalid
         """
-        if not isinstance(source, (ctypes.Array, Uint8Array)):
-            raise TypeError("Source needs to be a ctype array")
+        if isinstance(source, (bytes, bytearray, memoryview, array.array)):
+            source = memoryview(source).cast("B")
+        if not isinstance(source, (ctypes.Array, Uint8Array, memoryview)):
+            raise TypeError("Source needs to be a ctype array or a buffer")
         if not isinstance(offset, int) or offset < 0:
             raise ValueError("Offset needs to be a positive integer")
         if length is None:
@@ -73,8 +77,12 @@ class Uint8Array:
         self.buffer: ctypes.Array
         if isinstance(source, Uint8Array):
             self.buffer = (ctypes.c_ubyte * length).from_buffer(source.buffer, offset)
+        elif isinstance(source, memoryview) and source.readonly:
+            self.buffer = (ctypes.c_ubyte * length).from_buffer_copy(source, offset)
         else:
             self.buffer = (ctypes.c_ubyte * length).from_buffer(source, offset)
+        # the buffer is never re-assigned, so its address is stable for the array lifetime
+        self._addr = ctypes.addressof(self.buffer)
 
     @property
     def length(self) -> int:
@@ -112,9 +120,9 @@ class Uint8Array:
         :param source: Source array to copy from
         :return: Length of array after copy
         """
-        length_to_copy = min(self.length, len(source.buffer))
-        ctypes.memmove(self.buffer, source.buffer, length_to_copy)
-        return self.length
+        length_to_copy = self._length if self._length < source._length else source._length
+        ctypes.memmove(self._addr, source._addr, length_to_copy)
+        return self._length
 
     def __getitem__(self, index: Union[str, int]) -> Any:
         """Get item from array by index or property name.
@@ -123,6 +131,11 @@ class Uint8Array:
         :return: Value at index or property value
         :raises IndexError: If index is out of range or undefined
         """
+        if isinstance(index, int):
+            # upper bound is checked by ctypes, only negative indexes need to be rejected
+            if index < 0:
+                raise IndexError("Index out of range")
+            return self.buffer[index]
         if index == "length":
             return self.length
         if index == "buffer":
@@ -132,11 +145,7 @@ class Uint8Array:
         if index == "set":
             return self.set
         if index == "ptr":
-            return ctypes.addressof(self.buffer)
-        if isinstance(index, int):
-            if index < 0 or index >= self.length:
-                raise IndexError("Index out of range")
-            return self.buffer[index]
+            return self._addr
         raise IndexError("Index out of range or undefined")
 
     def __setitem__(self, index: int, value: int) -> None:
@@ -146,7 +155,7 @@ class Uint8Array:
         :param value: Value to set
         :raises IndexError: If index is out of range
         """
-        if index < 0 or index >= self.length:
+        if index < 0:
             raise IndexError("Index out of range")
         self.buffer[index] = value
 
@@ -202,6 +211,8 @@ class Int32Array:
             self.buffer = (ctypes.c_int32 * length).from_buffer(source.buffer, offset)
         else:
             self.buffer = (ctypes.c_int32 * length).from_buffer(source, offset)
+        # the buffer is never re-assigned, so its address is stable for the array lifetime
+        self._addr = ctypes.addressof(self.buffer)
 
     @property
     def length(self) -> int:
@@ -239,9 +250,9 @@ class Int32Array:
         :param source: Source Int32Array to copy values from
         :return: Length of array
         """
-        length_to_copy = min(self.length, len(source.buffer))
-        ctypes.memmove(self.buffer, source.buffer, length_to_copy)
-        return self.length
+        length_to_copy = self._length if self._length < source._length else source._length
+        ctypes.memmove(self._addr, source._addr, length_to_copy * INT32_SIZE)
+        return self._length
 
     def __getitem__(self, index: Union[str, int]) -> Any:
         """Get item from array by index or property name.
@@ -251,6 +262,11 @@ class Int32Array:
         :raises IndexError: If property name is not valid
         :return: Value at index or property value
         """
+        if isinstance(index, int):
+            # upper bound is checked by ctypes, only negative indexes need to be rejected
+            if index < 0:
+                raise IndexError("Index out of range")
+            return self.buffer[index]
         if index == "length":
             return self.length
         if index == "buffer":
@@ -260,12 +276,7 @@ class Int32Array:
         if index == "set":
             return self.set
         if index == "ptr":
-            # return f"{ctypes.addressof(self.buffer)}"
-            return ctypes.addressof(self.buffer)
-        if isinstance(index, int):
-            if index < 0 or index >= self.length:
-                raise IndexError("Index out of range")
-            return self.buffer[index]
+            return self._addr
         raise IndexError("Index out of range or undefined")
 
     def __setitem__(self, index: int, value: int) -> None:
@@ -275,7 +286,7 @@ class Int32Array:
         :param value: Integer value to set at index
         :raises IndexError: If index is out of range
         """
-        if index < 0 or index >= self.length:
+        if index < 0:
             raise IndexError("Index out of range")
         self.buffer[index] = value
 
@@ -297,64 +308,58 @@ class Int32Array:
 class WasmExceptionInfo:
     """Represents information about a WebAssembly exception."""
 
-    def __init__(self, exc_ptr: int, memory: wasmtime.Memory, store: wasmtime.Store) -> None:
+    def __init__(self, exc_ptr: int, heap: memoryview) -> None:
         """Initialize WasmExceptionInfo.
 
         :param exc_ptr: Pointer to the exception in WASM memory
-        :param memory: WASM memory instance
-        :param store: WASM store instance
+        :param heap: Byte view over the WASM linear memory
         """
         self.exc_ptr = exc_ptr
         self.ptr = exc_ptr - 24
-        self.memory = memory
-        self.store = store
+        self.heap = heap
+        self.heap32 = heap.cast("I")
 
     def get_type(self) -> int:
         """Get the exception type.
 
         :return: Integer representing the exception type
         """
-        return int.from_bytes(
-            self.memory.read(self.store, self.ptr + 4, self.ptr + 4 + 4), "little"
-        )
+        return self.heap32[(self.ptr + 4) >> 2]
 
     def get_destructor(self) -> int:
         """Get the destructor function pointer.
 
         :return: Integer representing the destructor function pointer
         """
-        return int.from_bytes(
-            self.memory.read(self.store, self.ptr + 8, self.ptr + 8 + 4), "little"
-        )
+        return self.heap32[(self.ptr + 8) >> 2]
 
     def set_caught(self, caught: bool) -> None:
         """Set whether the exception has been caught.
 
         :param caught: Boolean indicating if the exception was caught
         """
-        caught_val = 1 if caught else 0
-        self.memory.write(self.store, bytes([caught_val & 0xFF]), self.ptr + 12)
+        self.heap[self.ptr + 12] = 1 if caught else 0
 
     def set_type(self, ex_type: int) -> None:
         """Set the exception type.
 
         :param ex_type: Integer representing the exception type
         """
-        self.memory.write(self.store, ex_type.to_bytes(4, "little"), self.ptr + 4)
+        _U32.pack_into(self.heap, self.ptr + 4, ex_type)
 
     def set_destructor(self, destructor: int) -> None:
         """Set the destructor function pointer.
 
         :param destructor: Integer representing the destructor function pointer
         """
-        self.memory.write(self.store, destructor.to_bytes(4, "little"), self.ptr + 8)
+        _U32.pack_into(self.heap, self.ptr + 8, destructor)
 
     def set_adjusted_ptr(self, adjusted_ptr: int) -> None:
         """Set the adjusted pointer value.
 
         :param adjusted_ptr: Integer representing the adjusted pointer value
         """
-        self.memory.write(self.store, adjusted_ptr.to_bytes(4, "little"), self.ptr + 16)
+        _U32.pack_into(self.heap, self.ptr + 16, adjusted_ptr)
 
     def init(self, ex_type: int, destructor: int) -> None:
         """Initialize the exception info with type and destructor.
@@ -363,34 +368,42 @@ class WasmExceptionInfo:
         :param destructor: Integer representing the destructor function pointer
         """
         self.set_adjusted_ptr(0)
-        self.set_type(ex_type)
-        self.set_destructor(destructor)
+        # type and destructor are adjacent, write them at once
+        _U32X2.pack_into(self.heap, self.ptr + 4, ex_type, destructor)
 
 
 class WebixDapperWasm:
+    # Engine and compiled modules are shared, each instance only gets its own store
+    _engine: ClassVar[Optional[Engine]] = None
+    _modules: ClassVar[dict[str, Module]] = {}
+    _lock = threading.Lock()
+
     def __init__(self, context_path: Optional[str] = None) -> None:
         self.trace = False
         self.with_stack_control = False
-        config = Config()
-        config.cranelift_opt_level = "speed"
-        config.strategy = "cranelift"
-        engine = Engine(config)
-        self.store = Store(engine)
-        memory = Memory(
-            self.store, MemoryType(limits=Limits(min=1, max=int(2147483648 / (64 * 1024))))
-        )
-
-        self.linker = Linker(self.store.engine)
-        self.linker.define(self.store, "env", "memory", memory)
         if context_path is None:
             context_path = os.path.abspath(
                 os.path.join(os.path.dirname(__file__), "webix-dapper-wasm.wasm")
             )
-        self.module = Module.from_file(self.linker.engine, context_path)
+        with self._lock:
+            if WebixDapperWasm._engine is None:
+                config = Config()
+                config.cranelift_opt_level = "speed"
+                config.strategy = "cranelift"
+                WebixDapperWasm._engine = Engine(config)
+            engine = WebixDapperWasm._engine
+            if (module := self._modules.get(context_path)) is None:
+                module = self.load_module(engine, context_path)
+                self._modules[context_path] = module
+        self.module = module
+        self.store = Store(engine)
+        # filled from the exports once instantiated, the invokers bind the dict itself
+        self._dyncall_by_sig: dict[str, Callable[..., Any]] = {}
 
         self.instance = Instance(self.store, self.module, self.construct_imports())
+        # plain dict copy, lookups on the wasmtime mapping go through a Python level __getitem__
         self.exports: dict[str, Callable[..., Any]] = cast(
-            dict[str, Callable[..., Any]], self.instance.exports(self.store)
+            dict[str, Callable[..., Any]], dict(self.instance.exports(self.store))
         )
         self.memory: wasmtime.Memory = cast(wasmtime.Memory, self.exports["memory"])
 
@@ -402,15 +415,21 @@ class WebixDapperWasm:
 
         c_array = (ctypes.c_ubyte * size).from_address(ctypes.addressof(ptr.contents))
         self.HEAPU8 = Uint8Array(c_array)
+        # The heap is never resized (see emscripten_resize_heap), so the views stay valid
+        self._mv = memoryview(c_array).cast("B")
+        self._mv32 = self._mv.cast("I")
 
         self.registered_types: dict[str, Any] = {}
         self.type_dependencies: dict[int, Any] = {}
         self.awaiting_dependencies: dict[str, Any] = {}
-        self.emval_handles: list[Union[int, bool, float, None]] = []
-        self.emval_freelist: list[int] = []
+        # emval handles are even (2, 4, 6, 8 are reserved by val.h), the slot is handle >> 1
+        self.emval_values: list[Any] = []
+        self.emval_refcounts = array.array("i")
+        self.emval_freelist = array.array("i")
         self.emval_method_callers: list[Callable] = []
         self.emval_symbols: dict[str, Any] = {}
         self.struct_registrations: dict[str, Any] = {}
+        self.require_function_cache: dict[tuple[str, int], Callable[..., Any]] = {}
 
         def from_wire_type(handle: int) -> Any:
             rv = self.emval_to_value(handle)
@@ -418,9 +437,7 @@ class WebixDapperWasm:
             return rv
 
         def read_emval_ptr(ptr: int) -> Any:
-            return from_wire_type(
-                int.from_bytes(self.memory.read(self.store, ptr, ptr + 4), "little")
-            )
+            return from_wire_type(_U32.unpack_from(self._mv, ptr)[0])
 
         self.EmValType = {
             "name": "emscripten::val",
@@ -431,56 +448,13 @@ class WebixDapperWasm:
             "destructorFunction": lambda: None,
         }
 
+        self._dyncall_by_sig.update(
+            (name[len("dynCall_") :], fcn)
+            for name, fcn in self.exports.items()
+            if name.startswith("dynCall_")
+        )
         self._stack_save = self.create_export_wrapper("stackSave")
         self._stack_restore = self.create_export_wrapper("stackRestore")
-        self.dynCall_ii = self.create_export_wrapper("dynCall_ii")
-        self.dynCall_iiii = self.create_export_wrapper("dynCall_iiii")
-        self.dynCall_iii = self.create_export_wrapper("dynCall_iii")
-        self.dynCall_vi = self.create_export_wrapper("dynCall_vi")
-        self.dynCall_vii = self.create_export_wrapper("dynCall_vii")
-        self.dynCall_viii = self.create_export_wrapper("dynCall_viii")
-        self.dynCall_diiii = self.create_export_wrapper("dynCall_diiii")
-        self.dynCall_vid = self.create_export_wrapper("dynCall_vid")
-        self.dynCall_viiiii = self.create_export_wrapper("dynCall_viiiii")
-        self.dynCall_v = self.create_export_wrapper("dynCall_v")
-        self.dynCall_i = self.create_export_wrapper("dynCall_i")
-        self.dynCall_id = self.create_export_wrapper("dynCall_id")
-        self.dynCall_f = self.create_export_wrapper("dynCall_f")
-        self.dynCall_ff = self.create_export_wrapper("dynCall_ff")
-        self.dynCall_viiiiii = self.create_export_wrapper("dynCall_viiiiii")
-        self.dynCall_fii = self.create_export_wrapper("dynCall_fii")
-        self.dynCall_viif = self.create_export_wrapper("dynCall_viif")
-        self.dynCall_fi = self.create_export_wrapper("dynCall_fi")
-        self.dynCall_fif = self.create_export_wrapper("dynCall_fif")
-        self.dynCall_jiji = self.create_export_wrapper("dynCall_jiji")
-        self.dynCall_iidiiii = self.create_export_wrapper("dynCall_iidiiii")
-        self.dynCall_viijii = self.create_export_wrapper("dynCall_viijii")
-        self.dynCall_viiii = self.create_export_wrapper("dynCall_viiii")
-        self.dynCall_iiiiiiii = self.create_export_wrapper("dynCall_iiiiiiii")
-        self.dynCall_iiiiiiiiiii = self.create_export_wrapper("dynCall_iiiiiiiiiii")
-        self.dynCall_iiiii = self.create_export_wrapper("dynCall_iiiii")
-        self.dynCall_jiiii: Callable[..., Any] = self.create_export_wrapper("dynCall_jiiii")
-        self.dynCall_iiiiiiiiiiiii = self.create_export_wrapper("dynCall_iiiiiiiiiiiii")
-        self.dynCall_fiii = self.create_export_wrapper("dynCall_fiii")
-        self.dynCall_diii = self.create_export_wrapper("dynCall_diii")
-        self.dynCall_viiiiiii = self.create_export_wrapper("dynCall_viiiiiii")
-        self.dynCall_iiiiiii = self.create_export_wrapper("dynCall_iiiiiii")
-        self.dynCall_iiiiiiiiiiii = self.create_export_wrapper("dynCall_iiiiiiiiiiii")
-        self.dynCall_viiiiiiii = self.create_export_wrapper("dynCall_viiiiiiii")
-        self.dynCall_viiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiii")
-        self.dynCall_viiiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiiii")
-        self.dynCall_viiiiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiiiii")
-        self.dynCall_viiiiiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiiiiii")
-        self.dynCall_viiiiiiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiiiiiii")
-        self.dynCall_viiiiiiiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiiiiiiii")
-        self.dynCall_viiiiiiiiiiiiiii = self.create_export_wrapper("dynCall_viiiiiiiiiiiiiii")
-        self.dynCall_iiiiii = self.create_export_wrapper("dynCall_iiiiii")
-        self.dynCall_iiiiiiiii = self.create_export_wrapper("dynCall_iiiiiiiii")
-        self.dynCall_iiiiiiiiii = self.create_export_wrapper("dynCall_iiiiiiiiii")
-        self.dynCall_iiiiij = self.create_export_wrapper("dynCall_iiiiij")
-        self.dynCall_iiiiid = self.create_export_wrapper("dynCall_iiiiid")
-        self.dynCall_iiiiijj = self.create_export_wrapper("dynCall_iiiiijj")
-        self.dynCall_iiiiiijj = self.create_export_wrapper("dynCall_iiiiiijj")
 
     def __getitem__(self, item: str) -> Any:
         if item == "HEAPU8":
@@ -491,61 +465,44 @@ class WebixDapperWasm:
     def emval_to_value(self, handle: int) -> Any:
         if handle is None:
             raise ValueError(f"Cannot use deleted val. handle = {handle}")
-        return self.emval_handles[handle]
+        return self.emval_values[handle >> 1]
 
     def emval_to_handle(self, value: Any) -> int:
         if value is None:
-            ret_val = 2
-        elif value is True:
-            ret_val = 6
-        elif value is False:
-            ret_val = 8
+            return 2
+        if value is True:
+            return 6
+        if value is False:
+            return 8
+        if self.emval_freelist:
+            slot = self.emval_freelist.pop()
+            self.emval_values[slot] = value
+            self.emval_refcounts[slot] = 1
         else:
-            handle = self.emval_freelist.pop() if self.emval_freelist else len(self.emval_handles)
-            if handle is None:
-                raise ValueError(f"Cannot use deleted val. handle = {handle}")
-
-            if handle < len(self.emval_handles):
-                self.emval_handles[handle] = value
-            else:
-                self.emval_handles.extend([0] * (handle - len(self.emval_handles)))
-                self.emval_handles.append(value)
-
-            if handle + 1 < len(self.emval_handles):
-                self.emval_handles[handle + 1] = 1
-            else:
-                self.emval_handles.extend([0] * (handle + 1 - len(self.emval_handles)))
-                self.emval_handles.append(1)
-
-            ret_val = handle
-
-        return ret_val
+            slot = len(self.emval_values)
+            self.emval_values.append(value)
+            self.emval_refcounts.append(1)
+        return slot << 1
 
     def init_emval(self) -> None:
-        self.emval_handles.append(0)
-        self.emval_handles.append(1)
-        self.emval_handles.append(None)
-        self.emval_handles.append(1)
-        self.emval_handles.append(None)
-        self.emval_handles.append(1)
-        self.emval_handles.append(True)
-        self.emval_handles.append(1)
-        self.emval_handles.append(False)
-        self.emval_handles.append(1)
+        # 0 is unused, then undefined, null, true and false
+        self.emval_values.extend([0, None, None, True, False])
+        self.emval_refcounts.extend([1, 1, 1, 1, 1])
 
     def _emval_decref(self, handle: int) -> None:
-        item = self.emval_handles[handle + 1]
-        if isinstance(item, int):
-            if handle > 9 == item - 1:
-                self.emval_handles[handle] = None
-                self.emval_freelist.append(handle)
+        # handles up to 9 are the reserved values, they are never released
+        if handle > 9:
+            slot = handle >> 1
+            refcounts = self.emval_refcounts
+            count = refcounts[slot] - 1
+            refcounts[slot] = count
+            if not count:
+                self.emval_values[slot] = None
+                self.emval_freelist.append(slot)
 
     def _emval_incref(self, handle: int) -> None:
-        item = self.emval_handles[handle + 1]
-        if isinstance(item, int):
-            if handle > 9:
-                item += 1
-                self.emval_handles[handle + 1] = item
+        if handle > 9:
+            self.emval_refcounts[handle >> 1] += 1
 
     def runtime_init(self) -> None:
         self.exports["__wasm_call_ctors"](self.store)
@@ -553,478 +510,32 @@ class WebixDapperWasm:
 
     def create_export_wrapper(self, name: str) -> Callable[..., Any]:
         if name in self.exports:
-            f = self.exports[name]
-
-            def wrapper(*args: Tuple[Any, ...]) -> Any:
-                return f(*args)
-
-            return wrapper
+            return self.exports[name]
         return lambda *args: None
 
     def invoke(self, name: str, *args: Tuple[Any, ...]) -> Any:
         return self.exports[name](self.store, *args)
 
     def invoke_dyn(self, name: str, *args: Tuple[Any, ...]) -> Any:
-        return getattr(self, name)(*args)
-
-    def invoke_jiiii(self, index: int, a1: int, a2: int, a3: int, a4: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_jiiii(self.store, index, a1, a2, a3, a4)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_diii(self, index: int, a1: int, a2: int, a3: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_diii(self.store, index, a1, a2, a3)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_fiii(self, index: int, a1: int, a2: int, a3: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_fiii(self.store, index, a1, a2, a3)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_v(self, index: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_v(self.store, index)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_vi(self, index: int, a1: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_vi(self.store, index, a1)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_vii(self, index: int, a1: int, a2: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_vii(self.store, index, a1, a2)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viii(self, index: int, a1: int, a2: int, a3: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viii(self.store, index, a1, a2, a3)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiii(self, index: int, a1: int, a2: int, a3: int, a4: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiii(self.store, index, a1, a2, a3, a4)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiii(self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiii(self.store, index, a1, a2, a3, a4, a5)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiii(
-        self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int, a6: int
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiii(self.store, index, a1, a2, a3, a4, a5, a6)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiii(
-        self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int, a6: int, a7: int
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiii(
-        self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int, a6: int, a7: int, a8: int
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7, a8)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-        a12: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-        a12: int,
-        a13: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-        a12: int,
-        a13: int,
-        a14: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_viiiiiiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-        a12: int,
-        a13: int,
-        a14: int,
-        a15: int,
-    ) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_viiiiiiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_vid(self, index: int, a1: int, a2: int) -> None:
-        sp = self.stack_save()
-        try:
-            self.dynCall_vid(self.store, index, a1, a2)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_i(self, index: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_i(self.store, index)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_ii(self, index: int, a1: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_ii(self.store, index, a1)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iii(self, index: int, a1: int, a2: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iii(self.store, index, a1, a2)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiii(self, index: int, a1: int, a2: int, a3: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiii(self.store, index, a1, a2, a3)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiii(self, index: int, a1: int, a2: int, a3: int, a4: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiii(self.store, index, a1, a2, a3, a4)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiii(self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiii(self.store, index, a1, a2, a3, a4, a5)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiii(
-        self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int, a6: int
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiii(self.store, index, a1, a2, a3, a4, a5, a6)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiiii(
-        self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int, a6: int, a7: int
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiiiii(
-        self, index: int, a1: int, a2: int, a3: int, a4: int, a5: int, a6: int, a7: int, a8: int
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7, a8)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiiiiii(self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_iiiiiiiiiiiii(
-        self,
-        index: int,
-        a1: int,
-        a2: int,
-        a3: int,
-        a4: int,
-        a5: int,
-        a6: int,
-        a7: int,
-        a8: int,
-        a9: int,
-        a10: int,
-        a11: int,
-        a12: int,
-    ) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_iiiiiiiiiiiii(
-                self.store, index, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12
-            )
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
-
-    def invoke_id(self, index: int, a1: int) -> Any:
-        sp = self.stack_save()
-        try:
-            return self.dynCall_id(self.store, index, a1)
-        except RuntimeError as e:
-            self.stack_restore(sp)
-            raise e
+        if (fcn := self._dyncall_by_sig.get(name[len("dynCall_") :])) is None:
+            raise RuntimeError(f"{name} is not defined")
+        return fcn(self.store, *args)
+
+    def create_invoker(self, sig: str) -> Callable[..., Any]:
+        store = self.store
+        dyncall_by_sig = self._dyncall_by_sig
+
+        def invoker(index: int, *args: Any) -> Any:
+            if not self.with_stack_control:
+                return dyncall_by_sig[sig](store, index, *args)
+            sp = self._stack_save(store)
+            try:
+                return dyncall_by_sig[sig](store, index, *args)
+            except RuntimeError as e:
+                self._stack_restore(store, sp)
+                raise e
+
+        return invoker
 
     def environ_sizes_get(self, penviron_count: int, penviron_buf_size: int) -> int:
         logger.debug(f"environ_sizes_get {penviron_count}, {penviron_buf_size}")
@@ -1035,23 +546,33 @@ class WebixDapperWasm:
         return 0
 
     def fd_write(self, fd: int, iov: int, iovcnt: int, pnum: int) -> int:
+        if fd == 1:
+            stream = sys.stdout
+        elif fd == 2:
+            stream = sys.stderr
+        else:
+            raise ValueError(f"Unknown file descriptor {fd}")
+        # Pass the bytes through untouched when the stream exposes its binary buffer
+        buffer = getattr(stream, "buffer", None)
+        if buffer is not None:
+            stream.flush()
+        heap = self._mv
+        read_iov = _U32X2.unpack_from
         num = 0
 
         for _ in range(iovcnt):
-            ptr = int.from_bytes(self.memory.read(self.store, iov, iov + 4), "little")
-            length = int.from_bytes(self.memory.read(self.store, iov + 4, iov + 4 + 4), "little")
+            ptr, length = read_iov(heap, iov)
             iov += 8
-            for j in range(length):
-                byte = self.memory.read(self.store, ptr + j, ptr + j + 1)[0]
-                if fd == 1:
-                    print(chr(byte), end="")
-                elif fd == 2:
-                    print(chr(byte), end="", file=sys.stderr)
-                else:
-                    raise ValueError(f"Unknown file descriptor {fd}")
+            # windowed (PyInstaller) applications have no stdout/stderr, the output is dropped
+            if buffer is not None:
+                buffer.write(heap[ptr : ptr + length])
+            elif stream is not None:
+                stream.write(bytes(heap[ptr : ptr + length]).decode("latin-1", "replace"))
             num += length
 
-        self.memory.write(self.store, num.to_bytes(4, "little"), pnum)
+        _U32.pack_into(heap, pnum, num)
+        if stream is not None:
+            stream.flush()
 
         return 0
 
@@ -1064,33 +585,38 @@ class WebixDapperWasm:
         logger.warning("fd_close called")
 
     def dynCall(self, sig: str, ptr: int, *args: Tuple[Any, ...]) -> Any:
-        if args is None:
-            args = []
-        if not any(f"dynCall_{sig}" in item.name for item in self.module.exports):
-            raise RuntimeError(f'{"dynCall_" + sig} is not defined, bad function pointer')
-        return getattr(self, f"dynCall_{sig}")(self.store, ptr, *args)
+        if (fcn := self._dyncall_by_sig.get(sig)) is None:
+            raise RuntimeError(f"dynCall_{sig} is not defined, bad function pointer")
+        return fcn(self.store, ptr, *args)
 
     def dynCaller(self, sig: str, ptr: int) -> Callable[..., Any]:
-        return lambda *args: self.dynCall(sig, ptr, *args)
+        if (fcn := self._dyncall_by_sig.get(sig)) is None:
+            raise RuntimeError(f"dynCall_{sig} is not defined, bad function pointer")
+        store = self.store
+        return lambda *args: fcn(store, ptr, *args)
 
     def read_latin_1_string(self, ptr: int, max_bytes: int = -1) -> str:
-        chars = []
-        c = ptr
-        while True:
-            char = self.memory.read(self.store, c, c + 1)
-            if char == b"\x00" or (c >= ptr + max_bytes and max_bytes != -1):
+        end = len(self._mv) if max_bytes == -1 else min(ptr + max_bytes, len(self._mv))
+        # scan a bounded window at a time, one window holds any embind name or signature
+        chunks: list[bytes] = []
+        while ptr < end:
+            chunk = bytes(self._mv[ptr : min(ptr + 4096, end)])
+            terminator = chunk.find(0)
+            if terminator != -1:
+                if not chunks:
+                    return chunk[:terminator].decode("latin-1")
+                chunks.append(chunk[:terminator])
                 break
-            chars.append(char.decode())
-            c += 1
-        return "".join(chars)
+            chunks.append(chunk)
+            ptr += 4096
+        return b"".join(chunks).decode("latin-1")
 
     def heap_32_vector_to_array(self, arg_count: int, raw_arg_types_addr: int) -> list[int]:
-        array = [0] * arg_count
-        read = self.memory.read
-        for i in range(arg_count):
-            start = raw_arg_types_addr + i * 4
-            array[i] = int.from_bytes(read(self.store, start, start + 4), "little")
-        return array
+        if raw_arg_types_addr & 3:
+            data = self._mv[raw_arg_types_addr : raw_arg_types_addr + arg_count * 4]
+            return [value for (value,) in _U32.iter_unpack(data)]
+        base = raw_arg_types_addr >> 2
+        return self._mv32[base : base + arg_count].tolist()
 
     def get_function_name(self, name: str) -> str:
         signature: str = name.strip()
@@ -1103,11 +629,11 @@ class WebixDapperWasm:
 
     def embind_require_function(self, signature: int, raw_function: int) -> Callable:
         signature_translated = self.read_latin_1_string(signature)
-
-        def make_dyn_caller() -> Callable:
-            return self.dynCaller(signature_translated, raw_function)
-
-        return make_dyn_caller()
+        key = (signature_translated, raw_function)
+        if (caller := self.require_function_cache.get(key)) is None:
+            caller = self.dynCaller(signature_translated, raw_function)
+            self.require_function_cache[key] = caller
+        return caller
 
     def expose_public_symbol(self, name: str, value: Any, num_arguments: int) -> None:
         setattr(self, name, value)
@@ -1196,78 +722,34 @@ class WebixDapperWasm:
                 if arg_types[i]["destructorFunction"] is not None:
                     closure_args.append(arg_types[i]["destructorFunction"])
 
-        def executor0(
-            invoker: Callable = cpp_invoker_func,
-            invoke_fcn: int = cpp_target_func,
-            f_args: list[Any] = arg_types,
-            is_r: bool = returns,
-        ) -> Any:
-            rv = invoker(invoke_fcn)
-            if is_r:
-                ret = f_args[0]["fromWireType"](rv)
-                return ret
-            return None
+        # types are resolved at this point, bind the converters once instead of on every call
+        invoker = cpp_invoker_func
+        invoke_fcn = cpp_target_func
+        from_wire = arg_types[0]["fromWireType"] if returns else None
+        to_wires = [arg_type["toWireType"] for arg_type in arg_types[2:]]
+        to_wire_0, to_wire_1, to_wire_2 = (to_wires + [None, None, None])[:3]
 
-        def executor1(
-            arg0: Any,
-            invoker: Callable = cpp_invoker_func,
-            invoke_fcn: int = cpp_target_func,
-            f_args: list[Any] = arg_types,
-            is_r: bool = returns,
-        ) -> Any:
-            arg_0_wired = f_args[2]["toWireType"](None, arg0)
-            rv = invoker(invoke_fcn, arg_0_wired)
-            if is_r:
-                ret = f_args[0]["fromWireType"](rv)
-                return ret
-            return None
+        def executor0() -> Any:
+            rv = invoker(invoke_fcn)
+            return from_wire(rv) if from_wire else None
 
-        def executor2(
-            arg0: Any,
-            arg1: Any,
-            invoker: Callable = cpp_invoker_func,
-            invoke_fcn: int = cpp_target_func,
-            f_args: list[Any] = arg_types,
-            is_r: bool = returns,
-        ) -> Any:
-            arg_0_wired = f_args[2]["toWireType"](None, arg0)
-            arg_1_wired = f_args[3]["toWireType"](None, arg1)
-            rv = invoker(invoke_fcn, arg_0_wired, arg_1_wired)
-            if is_r:
-                ret = f_args[0]["fromWireType"](rv)
-                return ret
-            return None
+        def executor1(arg0: Any) -> Any:
+            rv = invoker(invoke_fcn, to_wire_0(None, arg0))
+            return from_wire(rv) if from_wire else None
 
-        def executor3(
-            arg0: Any,
-            arg1: Any,
-            arg2: Any,
-            invoker: Callable = cpp_invoker_func,
-            invoke_fcn: int = cpp_target_func,
-            f_args: list[Any] = arg_types,
-            is_r: bool = returns,
-        ) -> Any:
-            arg_0_wired = f_args[2]["toWireType"](None, arg0)
-            arg_1_wired = f_args[3]["toWireType"](None, arg1)
-            arg_2_wired = f_args[4]["toWireType"](None, arg2)
-            rv = invoker(invoke_fcn, arg_0_wired, arg_1_wired, arg_2_wired)
-            if is_r:
-                ret = f_args[0]["fromWireType"](rv)
-                return ret
-            return None
+        def executor2(arg0: Any, arg1: Any) -> Any:
+            rv = invoker(invoke_fcn, to_wire_0(None, arg0), to_wire_1(None, arg1))
+            return from_wire(rv) if from_wire else None
 
-        if arg_count - 2 == 0:
-            return lambda: executor0(cpp_invoker_func, cpp_target_func, arg_types)
-        if arg_count - 2 == 1:
-            return lambda *args: executor1(args[0], cpp_invoker_func, cpp_target_func, arg_types)
-        if arg_count - 2 == 2:
-            return lambda *args: executor2(
-                args[0], args[1], cpp_invoker_func, cpp_target_func, arg_types
-            )
-        if arg_count - 2 == 3:
-            return lambda *args: executor3(
-                args[0], args[1], args[2], cpp_invoker_func, cpp_target_func, arg_types
+        def executor3(arg0: Any, arg1: Any, arg2: Any) -> Any:
+            rv = invoker(
+                invoke_fcn, to_wire_0(None, arg0), to_wire_1(None, arg1), to_wire_2(None, arg2)
             )
+            return from_wire(rv) if from_wire else None
+
+        executors: tuple[Callable[..., Any], ...] = (executor0, executor1, executor2, executor3)
+        if arg_count - 2 < len(executors):
+            return executors[arg_count - 2]
         raise RuntimeError(f"arg_count={arg_count} not implemented in executor")
 
     def shared_register_type(
@@ -1326,20 +808,16 @@ class WebixDapperWasm:
         return self.emval_to_handle(v)
 
     def emval_lookup_types(self, arg_count: int, arg_types: int) -> list[Any]:
-        a = [0] * arg_count
-        for i in range(arg_count):
-            ptr = arg_types + i * 4
-            lookup_type = int.from_bytes(self.memory.read(self.store, ptr, ptr + 4), "little")
-            a[i] = self.require_registered_type(lookup_type, f"parameter {i}")
-        return a
+        return [
+            self.require_registered_type(lookup_type, f"parameter {i}")
+            for i, lookup_type in enumerate(self.heap_32_vector_to_array(arg_count, arg_types))
+        ]
 
     def emval_return_value(self, return_type: Any, destructors_ref: int, handle: Any) -> int:
         destructors: list[int] = []
         result = return_type["toWireType"](destructors, handle)
         if len(destructors) > 0:
-            self.memory.write(
-                self.store, self.emval_to_handle(destructors).to_bytes(4, "little"), destructors_ref
-            )
+            _U32.pack_into(self._mv, destructors_ref, self.emval_to_handle(destructors))
         # todo(mkelnar) void callbacks still requires f64 return value? issue in code or wasmtime behaviour?
         return result if result is not None else 0
 
@@ -1473,7 +951,10 @@ class WebixDapperWasm:
         return rv * 1.0
 
     def _emval_await(self, promise: int) -> Any:
-        return promise  # simple await bypass until api will be ready, self.emval_to_value(promise) otherwise in future
+        # simple await bypass until api will be ready, self.emval_to_value(promise) otherwise in future
+        # the caller releases the promise and owns the result, so hand out another reference
+        self._emval_incref(promise)
+        return promise
 
     def _emval_new_cstring(self, value: int) -> Any:
         handle = self.get_string_or_symbol(value)
@@ -1516,7 +997,7 @@ class WebixDapperWasm:
                 "argPackAdvance": 8,
                 "readValueFromPointer": lambda ptr, rt=raw_type: self.registered_types[f"{rt}"][
                     "fromWireType"
-                ](int.from_bytes(self.memory.read(self.store, ptr, ptr + 1), "little")),
+                ](self._mv[ptr]),
                 "destructorFunction": lambda: None,
             },
         )
@@ -1524,11 +1005,11 @@ class WebixDapperWasm:
     def integer_read_value_from_pointer(self, ptr: int, size: int, min_range: int) -> int:
         # pylint: disable=unused-argument
         if size == 1:
-            return int.from_bytes(self.memory.read(self.store, ptr, ptr + 1), "little")
+            return self._mv[ptr]
         if size == 2:
-            return int.from_bytes(self.memory.read(self.store, ptr, ptr + 2), "little")
+            return _U16.unpack_from(self._mv, ptr)[0]
         if size == 4:
-            return int.from_bytes(self.memory.read(self.store, ptr, ptr + 4), "little")
+            return _U32.unpack_from(self._mv, ptr)[0]
         raise ValueError(f"invalid integer width ({size}): {ptr}")
 
     def float_read_value_from_pointer(self, ptr: int, size: int) -> None:
@@ -1544,8 +1025,9 @@ class WebixDapperWasm:
 
         def from_wire_type(value: int) -> int:
             if min_range == 0:
+                # unsigned, wasm passes the value as a signed 32-bit integer
                 bit_shift = 32 - 8 * size
-                return value << bit_shift
+                return ((value << bit_shift) & 0xFFFFFFFF) >> bit_shift
             return value
 
         def to_wire_type(destructors: list[int], value: int) -> int:
@@ -1611,13 +1093,10 @@ class WebixDapperWasm:
         start = out_ptr
         # end = start + max_bytes_to_write - 1
         # todo(mkelnar) add true utf8 encoding here
-        for char in str_data:
-            c = ord(char)
-            self.memory.write(self.store, c.to_bytes(1, "little"), out_ptr)
-            out_ptr += 1
-
-        val = 0
-        self.memory.write(self.store, val.to_bytes(1, "little"), out_ptr)
+        data = str_data.encode("latin-1")
+        out_ptr += len(data)
+        self._mv[start:out_ptr] = data
+        self._mv[out_ptr] = 0
         return out_ptr - start
 
     def utf8_to_string(self, ptr: int, max_bytes: int) -> str:
@@ -1652,18 +1131,12 @@ class WebixDapperWasm:
         std_string_is_utf8 = name_val == "std::string"
 
         def from_wire_type(value: int) -> str:
-            length = int.from_bytes(self.memory.read(self.store, value, value + 4), "little")
+            length = _U32.unpack_from(self._mv, value)[0]
             payload = value + 4
-            raw_data = self.memory.read(self.store, payload, payload + length)
+            raw_data = bytes(self._mv[payload : payload + length])
             str_data = []
             if std_string_is_utf8:
-                decode_start_ptr = 0
-                for i in range(length + 1):
-                    current_byte = raw_data[i : i + 1]
-                    if i == length or current_byte == b"\x00":
-                        string_segment = raw_data[decode_start_ptr:i].decode("utf-8")
-                        str_data.append(string_segment)
-                        decode_start_ptr = i + 1
+                str_data = [segment.decode("utf-8") for segment in raw_data.split(b"\x00")]
             else:
                 raise NotImplementedError("non std::string strings not implemented")
             self.exports["free"](self.store, value)
@@ -1676,7 +1149,7 @@ class WebixDapperWasm:
             base = self.exports["malloc"](self.store, 4 + length + 1)
             ptr = base + 4
 
-            self.memory.write(self.store, length.to_bytes(4, "little"), base)
+            _U32.pack_into(self._mv, base, length)
 
             if std_string_is_utf8:
                 self.string_to_utf8(value, ptr, length + 1)
@@ -1697,7 +1170,7 @@ class WebixDapperWasm:
                 "argPackAdvance": 8,
                 "readValueFromPointer": lambda ptr, rt=raw_type: self.registered_types[f"{rt}"][
                     "fromWireType"
-                ](int.from_bytes(self.memory.read(self.store, ptr, ptr + 4), "little")),
+                ](_U32.unpack_from(self._mv, ptr)[0]),
                 "destructorFunction": lambda ptr: self.exports["free"](self.store, ptr),
             },
         )
@@ -1725,9 +1198,7 @@ class WebixDapperWasm:
                 "argPackAdvance": 8,
                 "readValueFromPointer": lambda ptr, del_type=raw_type: self.registered_types[
                     f"{del_type}"
-                ]["fromWireType"](
-                    int.from_bytes(self.memory.read(self.store, ptr, ptr + 4), "little")
-                ),
+                ]["fromWireType"](_U32.unpack_from(self._mv, ptr)[0]),
                 "destructorFunction": lambda ptr: self.exports["free"](self.store, ptr),
             },
         )
@@ -1882,9 +1353,7 @@ class WebixDapperWasm:
         def decode_memory_view(handle: int) -> Union[Uint8Array, Int32Array]:
             if ta not in {Uint8Array, Int32Array}:
                 raise NotImplementedError("Not implemented memory decoder")
-            sub = self.memory.read(self.store, handle, handle + 8)
-            size = int.from_bytes(sub[0:4], "little")
-            data = int.from_bytes(sub[4:8], "little")
+            size, data = _U32X2.unpack_from(self._mv, handle)
             result = ta(self.HEAPU8, data, size)
             return result
 
@@ -1957,12 +1426,8 @@ class WebixDapperWasm:
         type_addr_addr = self.stack_alloc(4)
         message_addr_addr = self.stack_alloc(4)
         self.exports["__get_exception_message"](self.store, ptr, type_addr_addr, message_addr_addr)
-        type_addr = int.from_bytes(
-            self.memory.read(self.store, type_addr_addr, type_addr_addr + 4), "little"
-        )
-        message_addr = int.from_bytes(
-            self.memory.read(self.store, message_addr_addr, message_addr_addr + 4), "little"
-        )
+        type_addr = _U32.unpack_from(self._mv, type_addr_addr)[0]
+        message_addr = _U32.unpack_from(self._mv, message_addr_addr)[0]
         ex_type = self.utf8_to_string(type_addr, 500)
         message = ex_type
         if message_addr:
@@ -1976,7 +1441,7 @@ class WebixDapperWasm:
         return self.with_stack_save(fcn_caller)
 
     def __cxa_throw(self, ptr: int, ex_type: int, destructor: int) -> None:
-        exc_info = WasmExceptionInfo(ptr, self.memory, self.store)
+        exc_info = WasmExceptionInfo(ptr, self._mv)
         exc_info.init(ex_type, destructor)
         exc_data = self.get_exception_message(ptr)
         raise RuntimeError(f"{str(exc_data)}")
@@ -2079,48 +1544,84 @@ class WebixDapperWasm:
             "fd_close": self.fd_close,
             "fd_seek": self.fd_seek,
             "fd_write": self.fd_write,
-            "invoke_diii": self.invoke_diii,
-            "invoke_fiii": self.invoke_fiii,
-            "invoke_id": self.invoke_id,
-            "invoke_i": self.invoke_i,
-            "invoke_ii": self.invoke_ii,
-            "invoke_iii": self.invoke_iii,
-            "invoke_iiii": self.invoke_iiii,
-            "invoke_iiiii": self.invoke_iiiii,
-            "invoke_iiiiii": self.invoke_iiiiii,
-            "invoke_iiiiiii": self.invoke_iiiiiii,
-            "invoke_iiiiiiii": self.invoke_iiiiiiii,
-            "invoke_iiiiiiiii": self.invoke_iiiiiiiii,
-            "invoke_iiiiiiiiii": self.invoke_iiiiiiiiii,
-            "invoke_iiiiiiiiiii": self.invoke_iiiiiiiiiii,
-            "invoke_iiiiiiiiiiii": self.invoke_iiiiiiiiiiii,
-            "invoke_iiiiiiiiiiiii": self.invoke_iiiiiiiiiiiii,
-            "invoke_jiiii": self.invoke_jiiii,
-            "invoke_v": self.invoke_v,
-            "invoke_vi": self.invoke_vi,
-            "invoke_vid": self.invoke_vid,
-            "invoke_vii": self.invoke_vii,
-            "invoke_viii": self.invoke_viii,
-            "invoke_viiii": self.invoke_viiii,
-            "invoke_viiiii": self.invoke_viiiii,
-            "invoke_viiiiii": self.invoke_viiiiii,
-            "invoke_viiiiiii": self.invoke_viiiiiii,
-            "invoke_viiiiiiii": self.invoke_viiiiiiii,
-            "invoke_viiiiiiiii": self.invoke_viiiiiiiii,
-            "invoke_viiiiiiiiii": self.invoke_viiiiiiiiii,
-            "invoke_viiiiiiiiiii": self.invoke_viiiiiiiiiii,
-            "invoke_viiiiiiiiiiii": self.invoke_viiiiiiiiiiii,
-            "invoke_viiiiiiiiiiiii": self.invoke_viiiiiiiiiiiii,
-            "invoke_viiiiiiiiiiiiii": self.invoke_viiiiiiiiiiiiii,
-            "invoke_viiiiiiiiiiiiiii": self.invoke_viiiiiiiiiiiiiii,
             "strftime_l": self.strftime_l,
         }
         for imp in self.module.imports:
             if (name := imp.name) in wasm_imports:
                 import_array.append(Func(self.store, cast(FuncType, imp.type), wasm_imports[name]))
+            elif name is not None and name.startswith("invoke_"):
+                invoker = self.create_invoker(name[len("invoke_") :])
+                import_array.append(Func(self.store, cast(FuncType, imp.type), invoker))
             else:
                 raise RuntimeError(f"{str(name)} not found in wasm imports")
         return import_array
 
-    def register_handler(self, fcn_handler: Callable) -> None:
-        setattr(self, fcn_handler.__name__, types.MethodType(fcn_handler, self))
+    @staticmethod
+    def load_module(engine: Engine, context_path: str) -> Module:
+        """Load the WASM module, reusing the compiled artifact from the disk cache if possible.
+
+        :param engine: Engine the module is compiled for
+        :param context_path: Path to the WASM file
+        :return: Compiled module
+        """
+        with open(context_path, "rb") as f:
+            wasm = f.read()
+        cache_folder = WebixDapperWasm.get_module_cache_folder()
+        if cache_folder is None:
+            return Module(engine, wasm)
+        try:
+            wasmtime_version = version("wasmtime")
+        except PackageNotFoundError:
+            wasmtime_version = "unknown"
+        digest = hashlib.blake2b(wasm, digest_size=16).hexdigest()
+        cache_path = os.path.join(cache_folder, f"webix-dapper-{wasmtime_version}-{digest}.cwasm")
+        try:
+            if os.path.isfile(cache_path):
+                return Module.deserialize_file(engine, cache_path)
+        except (OSError, wasmtime.WasmtimeError) as e:
+            logger.debug(f"Cached module {cache_path} cannot be used: {e}")
+
+        module = Module(engine, wasm)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cache_folder, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(module.serialize())
+            os.replace(tmp_path, cache_path)
+        except (OSError, wasmtime.WasmtimeError) as e:
+            logger.debug(f"Compiled module cannot be cached in {cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return module
+
+    @staticmethod
+    def get_module_cache_folder() -> Optional[str]:
+        """Get the SPSDK cache folder used for the compiled module.
+
+        The cache is optional, any problem with the SPSDK cache settings disables it.
+
+        :return: Cache folder path, None if the cache is disabled or unavailable
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            import spsdk
+            from spsdk.exceptions import SPSDKError
+            from spsdk.utils.database import get_spsdk_cache_dirname
+        except ImportError:
+            return None
+        if getattr(spsdk, "SPSDK_CACHE_DISABLED", False):
+            return None
+        try:
+            return get_spsdk_cache_dirname()
+        except SPSDKError as e:
+            logger.debug(f"Compiled module cache is disabled: {e}")
+            return None
+
+    def register_handler(self, fcn_handler: Callable, name: Optional[str] = None) -> None:
+        if name is None:
+            setattr(self, fcn_handler.__name__, types.MethodType(fcn_handler, self))
+        else:
+            # already bound callable, registered as is without binding it to this instance
+            setattr(self, name, fcn_handler)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# * ********************************************************************************************************* *
+# *
+# * Copyright 2024 NXP
+# *
+# * SPDX-License-Identifier: BSD-3-Clause
+# * The BSD-3-Clause license for this file can be found in the LICENSE.txt file included with this distribution
+# * or at https://spdx.org/licenses/BSD-3-Clause.html#licenseText
+# *
+# * ********************************************************************************************************* *
+"""Tests for the WASM glue of the WebixDapper module, no HW is needed."""
+
+import ctypes
+import struct
+
+import pytest
+from spsdk_mcu_link.dapper.webix_dapper import Interface, WebixDapper
+from spsdk_mcu_link.dapper.webix_dapper_wasm import Int32Array, Uint8Array, WebixDapperWasm
+
+RESERVED_HANDLES = (2, 4, 6, 8)
+
+
+class FakeProbe(Interface):
+    """Probe interface answering the DAP_Info command only."""
+
+    DAP_INFO = {
+        0x01: b"NXP\0",
+        0x02: b"MCU-Link\0",
+        0x03: b"FAKE1\0",
+        0x04: b"2.1.0\0",
+        0xF0: struct.pack("<H", 0x13),
+        0xFF: struct.pack("<H", 64),
+        0xFE: b"\x01",
+        0xFD: b"\x01",
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type = "fake"
+        self._device = object()
+        self.serial_no = "FAKE1"
+        self.responses: list[bytes] = []
+
+    def close(self) -> None:
+        pass
+
+    def write(self, data: Uint8Array) -> None:
+        command = bytes(data.buffer)
+        if command[0] == 0x00:
+            info = self.DAP_INFO.get(command[1], b"")
+            self.responses.append(bytes([0x00, len(info)]) + info)
+        else:
+            self.responses.append(bytes([command[0], 0x00]))
+
+    def read(self) -> Uint8Array:
+        return Uint8Array(bytearray(self.responses.pop(0).ljust(64, b"\0")))
+
+
+@pytest.fixture(name="module")
+def fixture_module() -> WebixDapperWasm:
+    module = WebixDapperWasm()
+    module.runtime_init()
+    return module
+
+
+@pytest.fixture(name="dapper")
+def fixture_dapper() -> WebixDapper:
+    dapper = WebixDapper()
+    dapper.open(FakeProbe())
+    return dapper
+
+
+def test_emval_slot_reuse(module: WebixDapperWasm):
+    handle = module.emval_to_handle("first")
+    assert handle % 2 == 0 and handle not in RESERVED_HANDLES
+    assert module.emval_to_value(handle) == "first"
+
+    module._emval_incref(handle)
+    module._emval_decref(handle)
+    assert module.emval_to_value(handle) == "first"
+    assert not module.emval_freelist
+
+    module._emval_decref(handle)
+    assert module.emval_to_value(handle) is None
+    assert list(module.emval_freelist) == [handle >> 1]
+
+    assert module.emval_to_handle("second") == handle
+    assert module.emval_to_value(handle) == "second"
+    assert not module.emval_freelist
+
+
+def test_emval_reserved_handles(module: WebixDapperWasm):
+    assert module.emval_to_handle(None) == 2
+    assert module.emval_to_handle(True) == 6
+    assert module.emval_to_handle(False) == 8
+    values = [module.emval_to_value(handle) for handle in RESERVED_HANDLES]
+
+    for handle in RESERVED_HANDLES:
+        for _ in range(3):
+            module._emval_decref(handle)
+    assert [module.emval_to_value(handle) for handle in RESERVED_HANDLES] == values
+    assert module.emval_to_value(6) is True and module.emval_to_value(8) is False
+    assert not module.emval_freelist
+
+
+def test_emval_table_bounded(dapper: WebixDapper):
+    module = dapper.module
+    vendor_ids = list(module.getSupportedVendorIDs())  # type: ignore[attr-defined]
+    probe_info = dapper.get_probe_dap_info()
+    table_size = len(module.emval_values)
+
+    for _ in range(50):
+        assert list(module.getSupportedVendorIDs()) == vendor_ids  # type: ignore[attr-defined]
+        assert dapper.get_probe_dap_info() == probe_info
+    assert len(module.emval_values) == table_size
+    assert vendor_ids and probe_info.serial_no == "FAKE1"
+    assert probe_info.firmware_ver == "2.1.0"
+
+
+def get_registered_type(module: WebixDapperWasm, name: str) -> dict:
+    return next(
+        reg_type
+        for reg_type in module.registered_types.values()
+        if isinstance(reg_type, dict) and reg_type["name"] == name
+    )
+
+
+@pytest.mark.parametrize(
+    "name, wire_value, value",
+    [
+        ("unsigned char", -1, 0xFF),
+        ("unsigned char", -128, 0x80),
+        ("unsigned short", -1, 0xFFFF),
+        ("unsigned short", -32768, 0x8000),
+        ("unsigned int", -1, 0xFFFFFFFF),
+        ("unsigned int", -0x80000000, 0x80000000),
+        ("unsigned int", 0x12345678, 0x12345678),
+        ("signed char", -1, -1),
+        ("short", -1, -1),
+        ("int", -1, -1),
+    ],
+)
+def test_integer_from_wire_type(module: WebixDapperWasm, name: str, wire_value: int, value: int):
+    assert get_registered_type(module, name)["fromWireType"](wire_value) == value
+
+
+@pytest.mark.parametrize(
+    "target_length, source_length",
+    [(5, 3), (3, 5), (4, 4)],
+)
+def test_int32_array_set(target_length: int, source_length: int):
+    source_values = list(range(-1, -1 - source_length, -1))
+    target = Int32Array((ctypes.c_int32 * target_length)(*[0x55AA55AA] * target_length))
+    source = Int32Array((ctypes.c_int32 * source_length)(*source_values))
+    copied = min(target_length, source_length)
+
+    assert target.set(source) == target_length
+    assert list(target.buffer) == source_values[:copied] + [0x55AA55AA] * (target_length - copied)